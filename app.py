@@ -9,127 +9,274 @@ Performs three types of transformations:
 
 import re
 import os
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 # from dotenv import load_dotenv
 import streamlit as st
-from googletrans import Translator
-from indic_transliteration import sanscript
-from indic_transliteration.sanscript import transliterate
-import google.generativeai as genai
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+# googletrans, indic_transliteration and google.generativeai are imported
+# where first used, so startup only pays for the backends actually needed
 
 # Load environment variables
 # load_dotenv()
 
+# Comprehensive English to Devanagari phonetic mapping
+_ENG_TO_DEV = MappingProxyType({
+    # Single letters - improved phonetic mapping
+    'a': 'अ', 'b': 'ब', 'c': 'क', 'd': 'द', 'e': 'ई', 'f': 'फ',
+    'g': 'ग', 'h': 'ह', 'i': 'आई', 'j': 'ज', 'k': 'क', 'l': 'ल',
+    'm': 'म', 'n': 'न', 'o': 'ओ', 'p': 'प', 'q': 'क्यू', 'r': 'आर', 
+    's': 'एस', 't': 'ट', 'u': 'यू', 'v': 'वी', 'w': 'डब्ल्यू', 
+    'x': 'एक्स', 'y': 'वाई', 'z': 'जेड',
+    
+    # Common consonant combinations
+    'th': 'थ', 'sh': 'श', 'ch': 'च', 'ph': 'फ', 'gh': 'घ',
+    'kh': 'ख', 'dh': 'ध', 'bh': 'भ', 'jh': 'झ', 'ng': 'ंग',
+    'ck': 'क', 'st': 'स्ट', 'sp': 'स्प', 'sc': 'स्क', 'sk': 'स्क',
+    
+    # Vowel combinations and sounds
+    'aa': 'आ', 'ee': 'ई', 'ii': 'ई', 'oo': 'ऊ', 'uu': 'ऊ',
+    'ai': 'ऐ', 'ay': 'ए', 'au': 'औ', 'aw': 'ऑ', 'ey': 'ए',
+    'ou': 'ओ', 'ow': 'आउ', 'oy': 'ऑय', 'ea': 'ई', 'ie': 'आई',
+    'oa': 'ओ', 'ue': 'यू', 'ui': 'यूआई', 'eu': 'यू',
+    
+    # Common words - high frequency
+    'the': 'द', 'and': 'एंड', 'are': 'आर', 'you': 'यू', 'for': 'फॉर',
+    'not': 'नॉट', 'but': 'बट', 'can': 'कैन', 'all': 'ऑल', 'any': 'एनी',
+    'had': 'हैड', 'her': 'हर', 'was': 'वॉज़', 'one': 'वन', 'our': 'आवर',
+    'out': 'आउट', 'day': 'डे', 'get': 'गेट', 'has': 'हैज़', 'him': 'हिम',
+    'his': 'हिज़', 'how': 'हाउ', 'man': 'मैन', 'new': 'न्यू', 'now': 'नाउ',
+    'old': 'ओल्ड', 'see': 'सी', 'two': 'टू', 'way': 'वे', 'who': 'हू',
+    'boy': 'बॉय', 'did': 'डिड', 'its': 'इट्स', 'let': 'लेट', 'put': 'पुट',
+    'say': 'से', 'she': 'शी', 'too': 'टू', 'use': 'यूज़', 'what': 'व्हाट',
+    'when': 'व्हेन', 'where': 'व्हेयर', 'why': 'व्हाई', 'with': 'विथ',
+    'will': 'विल', 'were': 'वर', 'been': 'बीन', 'have': 'हैव',
+    'this': 'दिस', 'that': 'दैट', 'they': 'दे', 'them': 'देम',
+    'there': 'देयर', 'then': 'देन', 'than': 'दैन', 'these': 'दीज़',
+    'those': 'दोज़', 'think': 'थिंक', 'through': 'थ्रू', 'time': 'टाइम',
+    'take': 'टेक', 'tell': 'टेल', 'turn': 'टर्न', 'try': 'ट्राई',
+    
+    # Story-specific words
+    'first': 'फर्स्ट', 'wife': 'वाइफ', 'wedding': 'वेडिंग', 'night': 'नाइट',
+    'lying': 'लाइंग', 'bed': 'बेड', 'quietly': 'क्वाइटली', 'said': 'सेड',
+    'die': 'डाई', 'died': 'डाइड', 'life': 'लाइफ', 'born': 'बॉर्न',
+    'married': 'मैरिड', 'marry': 'मैरी', 'guess': 'गेस', 'forgot': 'फॉरगॉट',
+    'about': 'अबाउट', 'need': 'नीड', 'needing': 'नीडिंग', 'kid': 'किड',
+    'child': 'चाइल्ड', 'suppose': 'सपोज़', 'might': 'माइट', 'led': 'लेड',
+    'live': 'लिव', 'lived': 'लिव्ड', 'long': 'लॉन्ग', 'care': 'केयर',
+    'daughter': 'डॉटर', 'remember': 'रिमेम्बर', 'mother': 'मदर',
+    'even': 'ईवन', 'well': 'वेल', 'doesnt': 'डज़न्ट',
+    
+    # Contractions and common patterns
+    "don't": 'डोन्ट', "doesn't": 'डज़न्ट', "didn't": 'डिडन्ट', 
+    "won't": 'वोन्ट', "can't": 'कान्ट', "isn't": 'इज़न्ट',
+    "aren't": 'आरन्ट', "wasn't": 'वॉज़न्ट', "weren't": 'वरन्ट',
+    "i'm": 'आइम', "you're": 'यूआर', "we're": 'वीआर', 
+    "they're": 'देयर', "it's": 'इट्स', "that's": 'दैट्स',
+    "what's": 'व्हाट्स', "where's": 'व्हेयर्स', "who's": 'हूज़',
+    
+    # Common endings
+    'ing': 'इंग', 'tion': 'शन', 'sion': 'शन', 'er': 'र', 'ed': 'ड',
+    'ly': 'ली', 'ty': 'टी', 'ry': 'री', 'al': 'ल', 'le': 'ल',
+    'ment': 'मेंट', 'ness': 'नेस', 'able': 'एबल', 'ible': 'इबल'
+})
+
+# Bump when _ENG_TO_DEV changes, to invalidate cached transliterations
+_ENG_TO_DEV_VERSION = 1
+
+# Hindi to Roman mapping for romanization, including matras
+_HINDI_TO_ROMAN = MappingProxyType({
+    # Vowels
+    'अ': 'a', 'आ': 'aa', 'इ': 'i', 'ई': 'ee', 'उ': 'u', 'ऊ': 'oo',
+    'ए': 'e', 'ऐ': 'ai', 'ओ': 'o', 'औ': 'au', 'अं': 'an', 'अः': 'ah',
+    
+    # Consonants with better mapping
+    'क': 'k', 'ख': 'kh', 'ग': 'g', 'घ': 'gh', 'ङ': 'ng',
+    'च': 'ch', 'छ': 'chh', 'ज': 'j', 'झ': 'jh', 'ञ': 'ny',
+    'ट': 't', 'ठ': 'th', 'ड': 'd', 'ढ': 'dh', 'ण': 'n',
+    'त': 't', 'थ': 'th', 'द': 'd', 'ध': 'dh', 'न': 'n',
+    'प': 'p', 'फ': 'ph', 'ब': 'b', 'भ': 'bh', 'म': 'm',
+    'य': 'y', 'र': 'r', 'ल': 'l', 'व': 'v', 'श': 'sh',
+    'ष': 'sh', 'स': 's', 'ह': 'h', 'क्ष': 'ksh', 'त्र': 'tr',
+    'ज्ञ': 'gy', 'ऋ': 'ri', 'ॐ': 'om',
+    
+    # Matras (vowel signs)
+    'ा': 'aa', 'ि': 'i', 'ी': 'ee', 'ु': 'u', 'ू': 'oo',
+    'े': 'e', 'ै': 'ai', 'ो': 'o', 'ौ': 'au', 'ं': 'n', 'ः': 'h',
+    '्': '', 'ँ': 'n'
+})
+
+# Punctuation and quotes kept around a word during transliteration
+_LEADING_PUNCT = '"\'('
+_TRAILING_PUNCT = '.,!?;:)\'"…'
+
+def _build_trie(keys):
+    """
+    Build a character trie from the given keys, marking key ends with ''
+    """
+    trie = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return trie
+
+def _trie_to_regex(node):
+    """
+    Convert a trie into a regex that matches the longest key at a position
+    """
+    branches = [re.escape(char) + _trie_to_regex(child)
+                for char, child in node.items() if char]
+    if not branches:
+        return ''
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        # Greedy optional group: prefer the longer key, fall back to this one
+        pattern = '(?:' + pattern + ')?'
+    return pattern
+
+def _compile_char_map(mapping):
+    """
+    Split a mapping into a regex for multi-character keys and a
+    str.translate table for single characters
+    """
+    multi = sorted((k for k in mapping if len(k) > 1), key=len, reverse=True)
+    multi_re = re.compile('|'.join(re.escape(k) for k in multi))
+    table = str.maketrans({k: v for k, v in mapping.items() if len(k) == 1})
+    return multi_re, table
+
+_HINDI_MULTI_RE, _HINDI_TT = _compile_char_map(_HINDI_TO_ROMAN)
+
+def _romanize_chars(hindi_text):
+    """
+    Map Devanagari characters to Roman, multi-character conjuncts first
+    
+    >>> _romanize_chars('ज्ञान')
+    'gyaan'
+    """
+    result = _HINDI_MULTI_RE.sub(lambda m: _HINDI_TO_ROMAN[m.group(0)], hindi_text)
+    return result.translate(_HINDI_TT)
+
+# Trie of all mapping keys compiled into one regex, so each position
+# walks at most one branch per character instead of trying every key
+_ENG_RE = re.compile(_trie_to_regex(_build_trie(_ENG_TO_DEV)))
+
+@lru_cache(maxsize=4096)
+def _transliterate_word(word):
+    """
+    Memoized longest-match transliteration of one word; words repeat
+    heavily in real text
+    """
+    # The trie pattern takes the longest key at each position;
+    # characters no key covers are left as they are
+    return _ENG_RE.sub(lambda m: _ENG_TO_DEV[m.group(0)], word)
+
+class TranslationError(Exception):
+    """
+    Raised when the text could not be translated by any service
+    """
+
+# Translations kept by TextTransformer before the oldest is dropped
+_MAX_CACHED_TRANSLATIONS = 256
+
 class TextTransformer:
     def __init__(self):
-        self.translator = Translator()
+        # (level, message) describing the translation backend, shown by the UI
+        self.api_status = None
+        
+        # Workers for multi-paragraph Google Translate requests. The cached
+        # transformer is shared by every session, so this caps how many of
+        # those paragraphs are in flight at once across all users; single
+        # paragraphs are translated on the caller's thread and never queue.
+        # googletrans' Translator is not thread-safe, so each thread keeps
+        # its own
+        self._translate_pool = ThreadPoolExecutor(max_workers=8)
+        self._translate_local = threading.local()
+        # Successful translations keyed by (text, use_gemini), shared by
+        # every session. Failures raise, so they are never stored
+        self._translations = {}
+        self._translations_lock = threading.Lock()
         
         # Initialize Google AI API
         # api_key = os.getenv('GOOGLE_API_KEY')
         api_key = st.secrets.get("GOOGLE_API_KEY")
         if api_key and api_key.strip() and not api_key.startswith('your_'):
             try:
+                import google.generativeai as genai
                 genai.configure(api_key=api_key)
-                # Try multiple model names to find the working one
-                model_names = ['gemini-1.5-flash', 'gemini-1.5-pro', 'gemini-pro', 'gemini-1.0-pro']
-                
-                for model_name in model_names:
-                    try:
-                        self.model = genai.GenerativeModel(model_name)
-                        # Try a simple test to validate the key and model
-                        test_response = self.model.generate_content("Test")
-                        self.use_gemini = True
-                        st.success(f"✅ Google Gemini API connected successfully with model: {model_name}")
-                        break
-                    except Exception as model_error:
-                        continue
-                
-                if not hasattr(self, 'use_gemini') or not self.use_gemini:
-                    raise Exception("No working Gemini model found")
+                # The transformer is built once per process (get_transformer),
+                # so this probe runs once rather than on every rerun
+                model_name = self._probe_gemini_model()
+                self.api_status = ('success', f"✅ Google Gemini API connected successfully with model: {model_name}")
                     
             except Exception as e:
                 self.use_gemini = False
-                st.warning(f"⚠️ Google API key issue: {str(e)}. Using Google Translate as fallback.")
+                self.api_status = ('warning', f"⚠️ Google API key issue: {str(e)}. Using Google Translate as fallback.")
         else:
             self.use_gemini = False
             if not api_key:
-                st.info("ℹ️ No Google API key found in .env file. Using Google Translate.")
+                self.api_status = ('info', "ℹ️ No Google API key found in .env file. Using Google Translate.")
             else:
-                st.warning("⚠️ Invalid Google API key format. Using Google Translate as fallback.")
+                self.api_status = ('warning', "⚠️ Invalid Google API key format. Using Google Translate as fallback.")
         
         # Comprehensive English to Devanagari phonetic mapping
-        self.eng_to_dev_map = {
-            # Single letters - improved phonetic mapping
-            'a': 'अ', 'b': 'ब', 'c': 'क', 'd': 'द', 'e': 'ई', 'f': 'फ',
-            'g': 'ग', 'h': 'ह', 'i': 'आई', 'j': 'ज', 'k': 'क', 'l': 'ल',
-            'm': 'म', 'n': 'न', 'o': 'ओ', 'p': 'प', 'q': 'क्यू', 'r': 'आर', 
-            's': 'एस', 't': 'ट', 'u': 'यू', 'v': 'वी', 'w': 'डब्ल्यू', 
-            'x': 'एक्स', 'y': 'वाई', 'z': 'जेड',
-            
-            # Common consonant combinations
-            'th': 'थ', 'sh': 'श', 'ch': 'च', 'ph': 'फ', 'gh': 'घ',
-            'kh': 'ख', 'dh': 'ध', 'bh': 'भ', 'jh': 'झ', 'ng': 'ंग',
-            'ck': 'क', 'st': 'स्ट', 'sp': 'स्प', 'sc': 'स्क', 'sk': 'स्क',
-            
-            # Vowel combinations and sounds
-            'aa': 'आ', 'ee': 'ई', 'ii': 'ई', 'oo': 'ऊ', 'uu': 'ऊ',
-            'ai': 'ऐ', 'ay': 'ए', 'au': 'औ', 'aw': 'ऑ', 'ey': 'ए',
-            'ou': 'ओ', 'ow': 'आउ', 'oy': 'ऑय', 'ea': 'ई', 'ie': 'आई',
-            'oa': 'ओ', 'ue': 'यू', 'ui': 'यूआई', 'eu': 'यू',
+        self.eng_to_dev_map = _ENG_TO_DEV
+        
+        # Hindi to Roman mapping for romanization
+        self.hindi_to_roman_map = _HINDI_TO_ROMAN
+        
+        # Post-processing replacements for romanized text. Keep out identity
+        # entries: in the single-pass regex they would consume characters
+        # that another replacement needs
+        self._roman_replacements = {
+            # Remove unwanted symbols
+            '~': '', '|': '', '^': '',
             
-            # Common words - high frequency
-            'the': 'द', 'and': 'एंड', 'are': 'आर', 'you': 'यू', 'for': 'फॉर',
-            'not': 'नॉट', 'but': 'बट', 'can': 'कैन', 'all': 'ऑल', 'any': 'एनी',
-            'had': 'हैड', 'her': 'हर', 'was': 'वॉज़', 'one': 'वन', 'our': 'आवर',
-            'out': 'आउट', 'day': 'डे', 'get': 'गेट', 'has': 'हैज़', 'him': 'हिम',
-            'his': 'हिज़', 'how': 'हाउ', 'man': 'मैन', 'new': 'न्यू', 'now': 'नाउ',
-            'old': 'ओल्ड', 'see': 'सी', 'two': 'टू', 'way': 'वे', 'who': 'हू',
-            'boy': 'बॉय', 'did': 'डिड', 'its': 'इट्स', 'let': 'लेट', 'put': 'पुट',
-            'say': 'से', 'she': 'शी', 'too': 'टू', 'use': 'यूज़', 'what': 'व्हाट',
-            'when': 'व्हेन', 'where': 'व्हेयर', 'why': 'व्हाई', 'with': 'विथ',
-            'will': 'विल', 'were': 'वर', 'been': 'बीन', 'have': 'हैव',
-            'this': 'दिस', 'that': 'दैट', 'they': 'दे', 'them': 'देम',
-            'there': 'देयर', 'then': 'देन', 'than': 'दैन', 'these': 'दीज़',
-            'those': 'दोज़', 'think': 'थिंक', 'through': 'थ्रू', 'time': 'टाइम',
-            'take': 'टेक', 'tell': 'टेल', 'turn': 'टर्न', 'try': 'ट्राई',
+            # Better vowel representations
+            'ii': 'ee', 'uu': 'oo', 'R^i': 'ri', 'RRi': 'ri',
             
-            # Story-specific words
-            'first': 'फर्स्ट', 'wife': 'वाइफ', 'wedding': 'वेडिंग', 'night': 'नाइट',
-            'lying': 'लाइंग', 'bed': 'बेड', 'quietly': 'क्वाइटली', 'said': 'सेड',
-            'die': 'डाई', 'died': 'डाइड', 'life': 'लाइफ', 'born': 'बॉर्न',
-            'married': 'मैरिड', 'marry': 'मैरी', 'guess': 'गेस', 'forgot': 'फॉरगॉट',
-            'about': 'अबाउट', 'need': 'नीड', 'needing': 'नीडिंग', 'kid': 'किड',
-            'child': 'चाइल्ड', 'suppose': 'सपोज़', 'might': 'माइट', 'led': 'लेड',
-            'live': 'लिव', 'lived': 'लिव्ड', 'long': 'लॉन्ग', 'care': 'केयर',
-            'take': 'टेक', 'daughter': 'डॉटर', 'remember': 'रिमेम्बर', 'mother': 'मदर',
-            'even': 'ईवन', 'well': 'वेल', 'too': 'टू', 'doesnt': 'डज़न्ट',
+            # Better consonant combinations
+            'ñ': 'ny',
             
-            # Contractions and common patterns
-            "don't": 'डोन्ट', "doesn't": 'डज़न्ट', "didn't": 'डिडन्ट', 
-            "won't": 'वोन्ट', "can't": 'कान्ट', "isn't": 'इज़न्ट',
-            "aren't": 'आरन्ट', "wasn't": 'वॉज़न्ट', "weren't": 'वरन्ट',
-            "i'm": 'आइम', "you're": 'यूआर', "we're": 'वीआर', 
-            "they're": 'देयर', "it's": 'इट्स', "that's": 'दैट्स',
-            "what's": 'व्हाट्स', "where's": 'व्हेयर्स', "who's": 'हूज़',
+            # Fix common transliteration issues
+            'M': 'm', 'H': 'h', '.n': 'n', '.m': 'm', '.h': 'h',
+            '.t': 't', '.d': 'd', '.s': 's', '.r': 'r', '.l': 'l',
             
-            # Common endings
-            'ing': 'इंग', 'tion': 'शन', 'sion': 'शन', 'er': 'र', 'ed': 'ड',
-            'ly': 'ली', 'ty': 'टी', 'ry': 'री', 'al': 'ल', 'le': 'ल',
-            'ment': 'मेंट', 'ness': 'नेस', 'able': 'एबल', 'ible': 'इबल'
+            # Fix spacing issues
+            ' .': '.', ' ,': ',', ' !': '!', ' ?': '?',
+            ' ;': ';', ' :': ':', "' ": "'", ' "': '"'
         }
+        self._roman_clean_re = re.compile('|'.join(
+            re.escape(k) for k in sorted(self._roman_replacements, key=len, reverse=True)))
+        # Start of text or of a sentence, followed by a lowercase letter
+        self._cap_re = re.compile(r'(^|\.\s+)([a-z])')
+
+    def _probe_gemini_model(self):
+        """
+        Point self.model at the first Gemini model that answers a test
+        request and return its name
+        """
+        import google.generativeai as genai
         
-        # Hindi to Roman mapping for romanization
-        self.hindi_to_roman_map = {
-            'अ': 'a', 'आ': 'aa', 'इ': 'i', 'ई': 'ee', 'उ': 'u', 'ऊ': 'oo',
-            'ए': 'e', 'ऐ': 'ai', 'ओ': 'o', 'औ': 'au', 'अं': 'an', 'अः': 'ah',
-            'क': 'k', 'ख': 'kh', 'ग': 'g', 'घ': 'gh', 'ङ': 'ng',
-            'च': 'ch', 'छ': 'chh', 'ज': 'j', 'झ': 'jh', 'ञ': 'ny',
-            'ट': 't', 'ठ': 'th', 'ड': 'd', 'ढ': 'dh', 'ण': 'n',
-            'त': 't', 'थ': 'th', 'द': 'd', 'ध': 'dh', 'न': 'n',
-            'प': 'p', 'फ': 'ph', 'ब': 'b', 'भ': 'bh', 'म': 'm',
-            'य': 'y', 'र': 'r', 'ल': 'l', 'व': 'v', 'श': 'sh',
-            'ष': 'sh', 'स': 's', 'ह': 'h', 'क्ष': 'ksh', 'त्र': 'tr',
-            'ज्ञ': 'gya', 'ऋ': 'ri', 'ॐ': 'om'
-        }
+        # Try multiple model names to find the working one
+        model_names = ['gemini-1.5-flash', 'gemini-1.5-pro', 'gemini-pro', 'gemini-1.0-pro']
+        
+        for model_name in model_names:
+            try:
+                model = genai.GenerativeModel(model_name)
+                # Try a simple test to validate the key and model
+                model.generate_content("Test")
+            except Exception:
+                continue
+            self.model = model
+            self.use_gemini = True
+            return model_name
+        
+        self.use_gemini = False
+        raise Exception("No working Gemini model found")
 
     def english_to_devanagari_transliteration(self, text):
         """
@@ -149,20 +296,12 @@ class TextTransformer:
             result_words = []
             
             for word in words:
-                # Handle punctuation and quotes
-                prefix = ''
-                suffix = ''
-                clean_word = word.lower()
-                
-                # Extract leading punctuation/quotes
-                while clean_word and clean_word[0] in '"\'(':
-                    prefix += clean_word[0]
-                    clean_word = clean_word[1:]
-                
-                # Extract trailing punctuation/quotes
-                while clean_word and clean_word[-1] in '.,!?;:)\'"…':
-                    suffix = clean_word[-1] + suffix
-                    clean_word = clean_word[:-1]
+                # Split off leading and trailing punctuation/quotes
+                lowered = word.lower()
+                stripped = lowered.lstrip(_LEADING_PUNCT)
+                clean_word = stripped.rstrip(_TRAILING_PUNCT)
+                prefix = lowered[:len(lowered) - len(stripped)]
+                suffix = stripped[len(clean_word):]
                 
                 if not clean_word:
                     result_words.append(word)
@@ -185,44 +324,13 @@ class TextTransformer:
         """
         Advanced word-level transliteration with better phonetic rules
         """
-        result = ""
-        i = 0
-        
-        while i < len(word):
-            matched = False
-            
-            # Try to match progressively shorter substrings
-            for length in range(min(8, len(word) - i), 0, -1):
-                if i + length <= len(word):
-                    substring = word[i:i+length]
-                    if substring in self.eng_to_dev_map:
-                        result += self.eng_to_dev_map[substring]
-                        i += length
-                        matched = True
-                        break
-            
-            if not matched:
-                # Apply phonetic rules for unmapped characters
-                char = word[i]
-                if char.isalpha():
-                    # Special case handling
-                    if char == 'y' and i > 0:  # 'y' in middle/end often sounds like 'ी'
-                        result += 'ी'
-                    elif char == 'w' and i < len(word) - 1 and word[i+1] in 'aeiou':
-                        result += 'व'  # 'w' before vowels
-                    elif char in self.eng_to_dev_map:
-                        result += self.eng_to_dev_map[char]
-                    else:
-                        result += char
-                else:
-                    result += char
-                i += 1
-        
-        return result
+        return _transliterate_word(word)
 
-    def english_to_hindi_translation(self, text):
+    def english_to_hindi_translation(self, text, on_chunk=None):
         """
-        Translate English text to Hindi using Google Gemini API or Google Translate
+        Translate English text to Hindi using Google Gemini API or Google Translate.
+        If on_chunk is given, Gemini output is streamed and on_chunk is called
+        with the partial translation as each chunk arrives
         """
         if self.use_gemini:
             try:
@@ -242,11 +350,19 @@ English Text to Translate:
 
 Hindi Translation:
 """
-                response = self.model.generate_content(input_prompt)
-                return response.text.strip()
+                if on_chunk is None:
+                    response = self.model.generate_content(input_prompt)
+                    return response.text.strip()
+                
+                chunks = []
+                for chunk in self.model.generate_content(input_prompt, stream=True):
+                    chunks.append(chunk.text)
+                    on_chunk(''.join(chunks))
+                return ''.join(chunks).strip()
             except Exception as e:
                 st.error(f"Gemini API error: {e}")
-                # Fallback to Google Translate
+                # Fallback to Google Translate for this call only; the shared
+                # model stays in use, since errors such as rate limits pass
                 return self._translate_with_googletrans(text)
         else:
             return self._translate_with_googletrans(text)
@@ -267,11 +383,29 @@ Hindi Translation:
         Fallback translation using Google Translate
         """
         try:
-            translation = self.translator.translate(text, src='en', dest='hi')
-            return translation.text
+            paragraphs = text.split('\n\n')
+            if len(paragraphs) == 1:
+                return self._translate_paragraph(text)
+            
+            # Longer input: translate paragraphs in parallel requests
+            return '\n\n'.join(self._translate_pool.map(self._translate_paragraph, paragraphs))
         except Exception as e:
-            st.error(f"Translation error: {e}")
-            return "Translation failed"
+            raise TranslationError(e) from e
+    
+    def _translate_paragraph(self, paragraph):
+        """
+        Translate one paragraph with the calling thread's own Translator
+        """
+        if not paragraph.strip():
+            return paragraph
+        
+        # One Translator per thread, so each keeps its connection pool
+        # between calls without sharing a non-thread-safe session
+        translator = getattr(self._translate_local, 'translator', None)
+        if translator is None:
+            from googletrans import Translator
+            translator = self._translate_local.translator = Translator()
+        return translator.translate(paragraph, src='en', dest='hi').text
 
     def hindi_to_roman_transliteration(self, hindi_text):
         """
@@ -279,6 +413,8 @@ Hindi Translation:
         """
         try:
             # Using indic-transliteration library for base conversion
+            from indic_transliteration import sanscript
+            from indic_transliteration.sanscript import transliterate
             roman_text = transliterate(hindi_text, sanscript.DEVANAGARI, sanscript.ITRANS)
             
             # Enhanced post-processing for better readability
@@ -295,45 +431,11 @@ Hindi Translation:
         """
         Clean and improve the romanized text for better readability
         """
-        # Remove unwanted symbols
-        text = text.replace('~', '').replace('|', '').replace('^', '')
-        
-        # Improve common patterns
-        replacements = {
-            # Better vowel representations
-            'aa': 'aa', 'ii': 'ee', 'uu': 'oo', 'R^i': 'ri', 'RRi': 'ri',
-            
-            # Better consonant combinations
-            'kh': 'kh', 'gh': 'gh', 'ch': 'ch', 'jh': 'jh', 'ñ': 'ny',
-            'th': 'th', 'dh': 'dh', 'ph': 'ph', 'bh': 'bh', 'sh': 'sh',
-            
-            # Fix common transliteration issues
-            'M': 'm', 'H': 'h', '.n': 'n', '.m': 'm', '.h': 'h',
-            '.t': 't', '.d': 'd', '.s': 's', '.r': 'r', '.l': 'l',
-            
-            # Better word endings
-            'ti': 'ti', 'te': 'te', 'ta': 'ta', 'tu': 'tu',
-            'ni': 'ni', 'ne': 'ne', 'na': 'na', 'nu': 'nu',
-            
-            # Fix spacing issues
-            ' .': '.', ' ,': ',', ' !': '!', ' ?': '?',
-            ' ;': ';', ' :': ':', "' ": "'", ' "': '"'
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
+        # Apply every replacement in one pass
+        text = self._roman_clean_re.sub(lambda m: self._roman_replacements[m.group(0)], text)
         
         # Capitalize first letter of sentences
-        sentences = text.split('. ')
-        capitalized = []
-        for sentence in sentences:
-            if sentence:
-                sentence = sentence.strip()
-                if sentence:
-                    sentence = sentence[0].upper() + sentence[1:] if len(sentence) > 1 else sentence.upper()
-            capitalized.append(sentence)
-        
-        result = '. '.join(capitalized)
+        result = self._cap_re.sub(lambda m: m.group(1) + m.group(2).upper(), text.strip())
         
         # Ensure first character is uppercase
         if result and result[0].islower():
@@ -345,68 +447,83 @@ Hindi Translation:
         """
         Enhanced fallback manual Hindi to Roman conversion
         """
-        # Extended mapping for better results
-        enhanced_map = {
-            # Vowels
-            'अ': 'a', 'आ': 'aa', 'इ': 'i', 'ई': 'ee', 'उ': 'u', 'ऊ': 'oo',
-            'ए': 'e', 'ऐ': 'ai', 'ओ': 'o', 'औ': 'au', 'अं': 'an', 'अः': 'ah',
-            
-            # Consonants with better mapping
-            'क': 'k', 'ख': 'kh', 'ग': 'g', 'घ': 'gh', 'ङ': 'ng',
-            'च': 'ch', 'छ': 'chh', 'ज': 'j', 'झ': 'jh', 'ञ': 'ny',
-            'ट': 't', 'ठ': 'th', 'ड': 'd', 'ढ': 'dh', 'ण': 'n',
-            'त': 't', 'थ': 'th', 'द': 'd', 'ध': 'dh', 'न': 'n',
-            'प': 'p', 'फ': 'ph', 'ब': 'b', 'भ': 'bh', 'म': 'm',
-            'य': 'y', 'र': 'r', 'ल': 'l', 'व': 'v', 'श': 'sh',
-            'ष': 'sh', 'स': 's', 'ह': 'h', 'क्ष': 'ksh', 'त्र': 'tr',
-            'ज्ञ': 'gya', 'ऋ': 'ri', 'ॐ': 'om',
-            
-            # Matras (vowel signs)
-            'ा': 'aa', 'ि': 'i', 'ी': 'ee', 'ु': 'u', 'ू': 'oo',
-            'े': 'e', 'ै': 'ai', 'ो': 'o', 'ौ': 'au', 'ं': 'n', 'ः': 'h',
-            '्': '', 'ँ': 'n'
-        }
-        
-        result = ""
-        for char in hindi_text:
-            if char in enhanced_map:
-                result += enhanced_map[char]
-            elif char.isspace() or not char.isalpha():
-                result += char
-            else:
-                result += char
+        result = _romanize_chars(hindi_text)
         
         # Clean up and capitalize properly
         result = self._clean_romanization(result)
         return result
 
-    def _manual_hindi_to_roman(self, hindi_text):
+    def _romanizing_callback(self, on_update):
         """
-        Fallback manual Hindi to Roman conversion
+        Build an on_chunk callback that reports the partial Hindi text and
+        the romanization of its completed sentences to on_update
         """
-        result = ""
-        for char in hindi_text:
-            if char in self.hindi_to_roman_map:
-                result += self.hindi_to_roman_map[char]
-            elif char.isspace() or not char.isalpha():
-                result += char
-            else:
-                result += char  # Keep unmapped characters
-        return result.title()
+        done = 0
+        hindi_roman = ''
+        
+        def on_chunk(partial):
+            nonlocal done, hindi_roman
+            # Romanize the whole completed prefix whenever a sentence ends, so
+            # capitalization and spacing match the final romanization
+            end = max(partial.rfind(mark) for mark in ('।', '.', '?', '!', '\n')) + 1
+            if end > done:
+                hindi_roman = self.hindi_to_roman_transliteration(partial[:end])
+                done = end
+            # Skip empty text, which the UI's bold markers would turn into a rule
+            if partial:
+                on_update('hindi_devanagari', partial)
+            if hindi_roman:
+                on_update('hindi_roman', hindi_roman)
+        
+        return on_chunk
+    
+    def _get_cached_translation(self, text):
+        """
+        Return the stored translation of text for the current backend, or
+        None if there isn't one
+        """
+        with self._translations_lock:
+            return self._translations.get((text, self.use_gemini))
+    
+    def _store_translation(self, text, translation):
+        """
+        Store a successful translation of text, dropping the oldest entry
+        once the store is full
+        """
+        with self._translations_lock:
+            if len(self._translations) >= _MAX_CACHED_TRANSLATIONS:
+                del self._translations[next(iter(self._translations))]
+            self._translations[(text, self.use_gemini)] = translation
 
-    def transform_text(self, input_text):
+    def transform_text(self, input_text, on_update=None):
         """
-        Perform all three transformations on the input text
+        Perform all three transformations on the input text. If on_update is
+        given, it is called as on_update(key, partial_text) while the
+        translation streams in
         """
         results = {}
         
-        with st.spinner('Performing transformations...'):
-            # 1. English in Devanagari script (transliteration)
-            eng_devanagari = self.english_to_devanagari_transliteration(input_text)
-            results['english_devanagari'] = eng_devanagari
+        # The worker needs this run's context to use the Streamlit cache
+        executor = ThreadPoolExecutor(
+            max_workers=1, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx()))
+        
+        with st.spinner('Performing transformations...'), executor:
+            # 1. English in Devanagari script (transliteration), run locally
+            # while the translation request below waits on the network
+            eng_devanagari = executor.submit(_cached_translit, self, input_text)
             
-            # 2. Hindi in Devanagari script (translation)
-            hindi_devanagari = self.english_to_hindi_translation(input_text)
+            # 2. Hindi in Devanagari script (translation). Failures raise, so
+            # they are never stored in the translation cache
+            hindi_devanagari = self._get_cached_translation(input_text)
+            if hindi_devanagari is None:
+                on_chunk = None if on_update is None else self._romanizing_callback(on_update)
+                try:
+                    hindi_devanagari = self.english_to_hindi_translation(input_text, on_chunk=on_chunk)
+                    self._store_translation(input_text, hindi_devanagari)
+                except TranslationError as e:
+                    st.error(f"Translation error: {e}")
+                    hindi_devanagari = "Translation failed"
+            results['english_devanagari'] = eng_devanagari.result()
             results['hindi_devanagari'] = hindi_devanagari
             
             # 3. Hindi in Roman script (romanization)
@@ -415,6 +532,21 @@ Hindi Translation:
         
         return results
 
+@st.cache_resource
+def get_transformer():
+    """
+    Shared transformer so reruns reuse the translator and Gemini model
+    """
+    return TextTransformer()
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _cached_translit(_transformer, text, map_version=_ENG_TO_DEV_VERSION):
+    """
+    Memoized English to Devanagari transliteration of a whole input. It
+    runs on transform_text's worker thread, so it must not draw a spinner
+    """
+    return _transformer.english_to_devanagari_transliteration(text)
+
 def streamlit_app():
     st.set_page_config(
         page_title="English to Hindi Text Transformer",
@@ -429,11 +561,16 @@ def streamlit_app():
     st.markdown("3. **Hindi in Roman script** (romanized Hindi)")
     
     # Add API status info
-    if 'transformer' not in st.session_state:
-        st.session_state.transformer = TextTransformer()
+    transformer = get_transformer()
+    
+    # The transformer is shared, so report how it connected once per session
+    if transformer.api_status and 'api_status_shown' not in st.session_state:
+        st.session_state.api_status_shown = True
+        level, message = transformer.api_status
+        getattr(st, level)(message)
     
     # Show API status
-    if st.session_state.transformer.use_gemini:
+    if transformer.use_gemini:
         st.info("🚀 Using Google Gemini API for high-quality translation")
     else:
         st.info("🔄 Using Google Translate as translation service")
@@ -455,9 +592,6 @@ def streamlit_app():
         if not input_text.strip():
             st.error("Please enter some text.")
         else:
-            # Process the text - no line limit restrictions
-            results = st.session_state.transformer.transform_text(input_text)
-            
             # Display results
             st.divider()
             st.subheader("📋 Results")
@@ -466,15 +600,28 @@ def streamlit_app():
             
             with col1:
                 st.markdown("### 🔤 English in Devanagari")
-                st.markdown(f"**{results['english_devanagari']}**")
+                eng_slot = st.empty()
                 
             with col2:
                 st.markdown("### Hindi in Devanagari")
-                st.markdown(f"**{results['hindi_devanagari']}**")
+                hindi_slot = st.empty()
                 
             with col3:
                 st.markdown("### 🔡 Hindi in Roman Script")
-                st.markdown(f"**{results['hindi_roman']}**")
+                roman_slot = st.empty()
+            
+            slots = {
+                'english_devanagari': eng_slot,
+                'hindi_devanagari': hindi_slot,
+                'hindi_roman': roman_slot,
+            }
+            
+            # Process the text - no line limit restrictions. Partial Hindi
+            # output is shown as it streams in, then replaced by the result
+            results = transformer.transform_text(
+                input_text, on_update=lambda key, text: slots[key].markdown(f"**{text}**"))
+            for key, slot in slots.items():
+                slot.markdown(f"**{results[key]}**")
             
             # Copy buttons
             st.divider()